@@ -1,15 +1,26 @@
 import { defineConfig, devices } from "@playwright/test";
 
+// Set PW_USE_DIST=1 to run against the production build served by
+// `vite preview` rather than the dev server, which compiles on request.
+const useDist = !!process.env.PW_USE_DIST;
+const baseURL = useDist ? "http://localhost:4173" : "http://localhost:5173";
+
 export default defineConfig({
   testDir: "./tests/e2e",
   fullyParallel: true,
   forbidOnly: !!process.env.CI,
   retries: process.env.CI ? 2 : 0,
-  workers: process.env.CI ? 1 : undefined,
+  // Tests are context-isolated, so CI can run them side by side as well
+  workers: process.env.CI ? "50%" : undefined,
   reporter: "html",
   use: {
-    baseURL: "http://localhost:5173",
+    baseURL,
+    // Granted when each context is created, not with a call afterwards
+    permissions: ["geolocation"],
     trace: "on-first-retry",
+    // The built app registers a service worker; keep it from serving stale
+    // responses across tests
+    serviceWorkers: useDist ? "block" : "allow",
   },
   projects: [
     {
@@ -22,8 +33,10 @@ export default defineConfig({
     },
   ],
   webServer: {
-    command: "npm run dev",
-    url: "http://localhost:5173",
+    command: useDist
+      ? "npm run build && npm run preview -- --port 4173 --strictPort"
+      : "npm run dev",
+    url: baseURL,
     reuseExistingServer: !process.env.CI,
     timeout: 120 * 1000,
   },
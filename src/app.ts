@@ -667,6 +667,9 @@ export function init(): void {
         .catch((e) => console.error("SW registration failed:", e));
     });
   }
+
+  // Signal that the UI is wired up, so automation can wait on it
+  document.body.dataset.ready = "true";
 }
 
 // Check if running in a test environment
@@ -14,6 +14,7 @@ describe("Speedometer App", () => {
     vi.useFakeTimers();
 
     // Reset DOM
+    delete document.body.dataset.ready;
     document.body.innerHTML = `
       <div class="top-messages-container">
         <div id="warning" class="warning pill" hidden>Speed data is old</div>
@@ -132,6 +133,12 @@ describe("Speedometer App", () => {
     expect(warningEl.hidden).toBe(true);
   });
 
+  it("marks the body as ready once initialized", () => {
+    expect(document.body.dataset.ready).toBeUndefined();
+    init();
+    expect(document.body.dataset.ready).toBe("true");
+  });
+
   it("toggles units when button is clicked", () => {
     init();
     expect(unitBtn.textContent).toBe("mph");
@@ -0,0 +1,121 @@
+import {
+  type BrowserContext,
+  type BrowserContextOptions,
+  devices,
+  type Page,
+  test as base,
+} from "@playwright/test";
+
+// Device profiles are looked up once at import. Only the context options are
+// kept, since defaultBrowserType can't be set on a context created in a test.
+function contextOptionsFor(deviceName: string) {
+  const { viewport, userAgent, deviceScaleFactor, isMobile, hasTouch } =
+    devices[deviceName];
+  return { viewport, userAgent, deviceScaleFactor, isMobile, hasTouch };
+}
+
+export const IPHONE_13 = contextOptionsFor("iPhone 13");
+export const PIXEL_7 = contextOptionsFor("Pixel 7");
+
+// Init scripts are kept as plain JS strings so the same text is sent to
+// every context without re-serialising a function each time.
+
+// Enable Test Mode to bypass strict device checks
+const TEST_MODE_MOCK = "window.__TEST_MODE__ = true;";
+
+// Mock Geolocation if missing (unlikely in Playwright but good fallback)
+const GEOLOCATION_FALLBACK_MOCK = `
+if (!("geolocation" in navigator)) {
+  navigator.geolocation = {
+    watchPosition: () => {},
+    clearWatch: () => {},
+  };
+}
+`;
+
+// Prevent auto-opening of the popover to ensure consistent test state
+const STORAGE_RESET = `
+localStorage.clear();
+localStorage.setItem("info-popover-shown", "true");
+`;
+
+const APP_MOCKS = [
+  TEST_MODE_MOCK,
+  GEOLOCATION_FALLBACK_MOCK,
+  STORAGE_RESET,
+].join("\n");
+
+/**
+ * Installs the app's test mocks on a context. Location access is granted
+ * through the permissions context option rather than here.
+ */
+async function installAppMocks(context: BrowserContext): Promise<void> {
+  // Inject mocks BEFORE the page loads scripts to pass startup checks
+  await context.addInitScript(APP_MOCKS);
+}
+
+/**
+ * Opens the app and waits until init() has finished wiring up the UI.
+ * Navigation only waits for the response to commit, so the ready flag is the
+ * actual wait condition rather than the load event.
+ */
+export async function gotoApp(page: Page): Promise<void> {
+  await page.goto("/", { waitUntil: "commit" });
+  await page.locator("body[data-ready='true']").waitFor({ state: "attached" });
+}
+
+/**
+ * Resolves once no CSS transitions or animations are running, e.g. after the
+ * info popover finishes sliding in.
+ */
+export async function waitForAnimations(page: Page): Promise<void> {
+  await page.waitForFunction(
+    () =>
+      !document
+        .getAnimations()
+        .some((animation) => animation.playState === "running"),
+  );
+}
+
+/**
+ * Shared fixtures for the e2e suite.
+ *
+ * Playwright keeps one browser per worker; each test gets a fresh context
+ * with the app's test mocks installed at creation time, so individual tests
+ * only need to navigate.
+ */
+export const test = base.extend<{
+  appMocks: boolean;
+  newAppContext: (options: BrowserContextOptions) => Promise<BrowserContext>;
+}>({
+  // Opt out with test.use({ appMocks: false }) to exercise real device checks
+  appMocks: [true, { option: true }],
+  // For tests that need their own device profile. Contexts inherit the same
+  // config options as the default context fixture and are closed afterwards.
+  newAppContext: async (
+    { browser, baseURL, permissions, serviceWorkers },
+    use,
+  ) => {
+    const contexts: BrowserContext[] = [];
+    await use(async (options) => {
+      const context = await browser.newContext({
+        baseURL,
+        permissions,
+        serviceWorkers,
+        ...options,
+      });
+      contexts.push(context);
+      await installAppMocks(context);
+      return context;
+    });
+    await Promise.all(contexts.map((context) => context.close()));
+  },
+  context: async ({ context, appMocks }, use) => {
+    if (appMocks) {
+      await installAppMocks(context);
+    }
+    await use(context);
+  },
+});
+
+export { expect } from "@playwright/test";
@@ -1,32 +1,15 @@
-import { expect, test } from "@playwright/test";
+import {
+  expect,
+  gotoApp,
+  IPHONE_13,
+  PIXEL_7,
+  test,
+  waitForAnimations,
+} from "./fixtures";
 
 test.describe("Speedometer UI & Layout", () => {
-  test.beforeEach(async ({ page, context }) => {
-    await context.grantPermissions(["geolocation"]);
-
-    // Inject mocks BEFORE the page loads scripts to pass startup checks
-    await page.addInitScript(() => {
-      // Enable Test Mode to bypass strict device checks
-      // biome-ignore lint/suspicious/noExplicitAny: Mocking global for testing
-      (window as any).__TEST_MODE__ = true;
-
-      // Mock Geolocation if missing (unlikely in Playwright but good fallback)
-      if (!("geolocation" in navigator)) {
-        // biome-ignore lint/suspicious/noExplicitAny: Mocking global for testing
-        (navigator as any).geolocation = {
-          // biome-ignore lint/suspicious/noExplicitAny: Mocking global for testing
-          watchPosition: (_success: any) => {},
-          clearWatch: () => {},
-        };
-      }
-
-      // Clear storage
-      localStorage.clear();
-      // Prevent auto-opening of the popover to ensure consistent test state
-      localStorage.setItem("info-popover-shown", "true");
-    });
-
-    await page.goto("/");
+  test.beforeEach(async ({ page }) => {
+    await gotoApp(page);
   });
 
   test("Initial text consistency and case", async ({ page }) => {
@@ -48,9 +31,8 @@ test.describe("Speedometer UI & Layout", () => {
     await page.setViewportSize({ width: 800, height: 400 });
 
     const popover = page.locator("#info-popover");
-    if (!(await popover.isVisible())) {
-      await page.locator(".info-btn").click();
-    }
+    // Auto-open is suppressed in test setup, so open it explicitly
+    await page.locator(".info-btn").click();
     await expect(popover).toBeVisible();
 
     const maxWidthStr = await popover.evaluate((el) => {
@@ -63,4 +45,214 @@ test.describe("Speedometer UI & Layout", () => {
     expect(maxWidth).toBeGreaterThan(600);
     expect(maxWidth).toBeLessThanOrEqual(700.5);
   });
+
+  test("Landscape Layout - Unit button moves beside status", async ({
+    page,
+  }) => {
+    await page.setViewportSize({ width: 800, height: 400 });
+
+    // Read every box in one round-trip; layout is computed once for all reads
+    const boxes = await page.evaluate(() => {
+      const pick = (selector: string) => {
+        const rect = (
+          document.querySelector(selector) as Element
+        ).getBoundingClientRect();
+        return { x: rect.x, y: rect.y, width: rect.width, height: rect.height };
+      };
+      return {
+        speed: pick(".speed"),
+        portraitUnit: pick("#unit"),
+        landscapeUnit: pick("button.landscape-unit"),
+        bottomBar: pick(".bottom-bar"),
+        status: pick("#status"),
+      };
+    });
+
+    expect(boxes.speed.width).toBeGreaterThan(0);
+    expect(boxes.portraitUnit.width).toBe(0);
+
+    for (const box of [boxes.landscapeUnit, boxes.status]) {
+      expect(box.y).toBeGreaterThanOrEqual(boxes.bottomBar.y);
+      expect(box.y + box.height).toBeLessThanOrEqual(
+        boxes.bottomBar.y + boxes.bottomBar.height,
+      );
+    }
+    expect(boxes.landscapeUnit.x).toBeGreaterThanOrEqual(
+      boxes.status.x + boxes.status.width,
+    );
+  });
+});
+
+const IOS_POPOVER_VIEWPORTS = [
+  {
+    name: "ios-portrait",
+    viewport: IPHONE_13.viewport,
+  },
+  {
+    name: "ios-landscape",
+    viewport: {
+      width: IPHONE_13.viewport.height,
+      height: IPHONE_13.viewport.width,
+    },
+  },
+];
+
+test.describe("Info popover", () => {
+  test("Opens in every iOS orientation", async ({
+    newAppContext,
+  }, testInfo) => {
+    // Orientations share the device profile, so one context serves every page
+    const context = await newAppContext(IPHONE_13);
+
+    const capture = async ({
+      name,
+      viewport,
+    }: (typeof IOS_POPOVER_VIEWPORTS)[number]) => {
+      const page = await context.newPage();
+      await page.setViewportSize(viewport);
+      await gotoApp(page);
+
+      await page.locator(".info-btn").click();
+      await expect(page.locator("#info-popover")).toBeVisible();
+      await expect(page.locator("#ios-instructions")).toBeVisible();
+      await expect(page.locator("#android-instructions")).toBeHidden();
+      // Capture the settled popover, not a frame of its opening transition
+      await waitForAnimations(page);
+
+      await testInfo.attach(`popover-${name}`, {
+        body: await page.screenshot(),
+        contentType: "image/png",
+      });
+    };
+
+    // Pages load side by side within the shared context
+    await Promise.all(IOS_POPOVER_VIEWPORTS.map(capture));
+  });
+
+  test("Shows only the Android instructions on Android", async ({
+    newAppContext,
+  }) => {
+    // A different user agent needs its own context; the init-script mocks are
+    // per context, so reloading an iOS page would not switch platforms
+    const context = await newAppContext(PIXEL_7);
+    const page = await context.newPage();
+    await gotoApp(page);
+
+    await page.locator(".info-btn").click();
+    await expect(page.locator("#info-popover")).toBeVisible();
+    await expect(page.locator("#android-instructions")).toBeVisible();
+    await expect(page.locator("#ios-instructions")).toBeHidden();
+  });
+
+  test("Exit animation follows the info button across resizes", async ({
+    page,
+  }) => {
+    // Read the exit target and the icon position in a single round-trip
+    const readExitState = () =>
+      page.evaluate(() => {
+        const popover = document.getElementById("info-popover") as HTMLElement;
+        const icon = document.querySelector(".info-btn svg") as SVGElement;
+        const rect = icon.getBoundingClientRect();
+        return {
+          exitX: parseFloat(popover.style.getPropertyValue("--exit-x")),
+          exitY: parseFloat(popover.style.getPropertyValue("--exit-y")),
+          iconOffsetX: rect.left + rect.width / 2 - window.innerWidth / 2,
+          iconOffsetY: rect.top + rect.height / 2 - window.innerHeight / 2,
+        };
+      });
+
+    await page.setViewportSize({ width: 375, height: 667 });
+    await gotoApp(page);
+    const before = await readExitState();
+
+    // Moving the icon must move the target the popover collapses toward
+    await page.setViewportSize({ width: 800, height: 400 });
+    await page.locator(".info-btn").click();
+    await expect(page.locator("#info-popover")).toBeVisible();
+    const after = await readExitState();
+
+    expect(after.exitX).not.toBeCloseTo(before.exitX, 0);
+    expect(after.exitY).not.toBeCloseTo(before.exitY, 0);
+    expect(after.exitX).toBeCloseTo(after.iconOffsetX, 0);
+    expect(after.exitY).toBeCloseTo(after.iconOffsetY, 0);
+  });
+});
+
+test.describe("Device detection", () => {
+  test.use({ appMocks: false });
+
+  test("Shows the speedometer only on GPS-capable devices", async ({
+    page,
+    isMobile,
+  }) => {
+    await page.goto("/");
+
+    // Desktop Chrome reports userAgentData.mobile === false and must be
+    // rejected; the iPhone project must get the speedometer. The static
+    // markup already contains .speed, so require the ready flag as well.
+    const speed = page.locator("body[data-ready='true'] .speed");
+    const unsupported = page.locator(".unsupported");
+    const [expected, absent] = isMobile
+      ? [speed, unsupported]
+      : [unsupported, speed];
+
+    await expect(expected).toBeVisible();
+    await expect(absent).toHaveCount(0);
+  });
+});
+
+// Delivers a single fix with a valid speed, then goes silent
+const STALE_GEOLOCATION_MOCK = `
+Object.defineProperty(navigator, "geolocation", {
+  configurable: true,
+  value: {
+    watchPosition: (success) => {
+      success({ coords: { speed: 10, accuracy: 5 }, timestamp: Date.now() });
+      return 1;
+    },
+    clearWatch: () => {},
+  },
+});
+`;
+
+// Expected digit groups after the jump. Patterns leave room for the few
+// real-time milliseconds that pass between the fix and the jump.
+const STALE_CASES = [
+  { name: "seconds", advance: 12_000, digits: [/^1[2-9]$/] },
+  { name: "minutes", advance: 65_000, digits: ["1", /^0[5-9]$/] },
+  { name: "hours", advance: "02:00:00", digits: ["2", "00"] },
+];
+
+test.describe("Stale data warning", () => {
+  test.beforeEach(async ({ page }) => {
+    // Fake timers let the test jump ahead instead of waiting in real time
+    await page.clock.install();
+    await page.addInitScript(STALE_GEOLOCATION_MOCK);
+    await gotoApp(page);
+  });
+
+  test("Warning is hidden while data is fresh", async ({ page }) => {
+    await expect(page.locator("#speed")).toHaveAttribute(
+      "data-placeholder-visible",
+      "false",
+    );
+    await expect(page.locator("#warning")).toBeHidden();
+  });
+
+  // Each age is its own test so the cases run in parallel, each with its own
+  // clock, rather than stepping one page through every threshold in turn
+  for (const { name, advance, digits } of STALE_CASES) {
+    test(`Warning shows data age in ${name}`, async ({ page }) => {
+      const warning = page.locator("#warning");
+
+      await expect(page.locator("#speed")).toHaveAttribute(
+        "data-placeholder-visible",
+        "false",
+      );
+
+      await page.clock.fastForward(advance);
+      await expect(warning).toBeVisible();
+      await expect(warning.locator(".warning-digits")).toHaveText(digits);
+    });
+  }
 });